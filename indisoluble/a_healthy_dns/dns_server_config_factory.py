@@ -29,8 +29,8 @@ class DnsServerConfig(NamedTuple):
     """DNS server configuration containing zone data and security settings."""
 
     zone_origins: ZoneOrigins
-    primary_name_server: str
-    name_servers: frozenset[str]
+    primary_name_server: dns.name.Name
+    name_servers: frozenset[dns.name.Name]
     a_records: frozenset[AHealthyRecord]
     ext_private_key: ExtendedPrivateKey | None
 
@@ -131,11 +131,18 @@ def _make_healthy_a_record(
         return None
 
     try:
-        healthy_ips = [AHealthyIp(ip, health_port, False) for ip in ip_list]
+        healthy_ips = frozenset(AHealthyIp(ip, health_port, False) for ip in ip_list)
     except ValueError as ex:
         logging.error("Invalid IP/port address in '%s': %s", subdomain, ex)
         return None
 
+    if len(healthy_ips) < len(ip_list):
+        logging.debug(
+            "Collapsed %d duplicate IPs in '%s'",
+            len(ip_list) - len(healthy_ips),
+            subdomain,
+        )
+
     return AHealthyRecord(subdomain_name, healthy_ips)
 
 
@@ -159,19 +166,25 @@ def _make_a_records(
         logging.error("Zone resolutions cannot be empty")
         return None
 
-    a_records = []
+    a_records = set()
     for subdomain, sub_config in raw_resolutions.items():
         a_record = _make_healthy_a_record(origin_name, subdomain, sub_config)
         if a_record is None:
-            logging.error("Failed to create A record for '%s'", subdomain)
             return None
 
-        a_records.append(a_record)
+        # Records compare by owner name, which DNS matches case-insensitively
+        if a_record in a_records:
+            logging.error("Zone resolution subdomain '%s' is duplicated", subdomain)
+            return None
+
+        a_records.add(a_record)
 
     return frozenset(a_records)
 
 
-def _make_name_servers(args: dict[str, Any]) -> tuple[str, frozenset[str]] | None:
+def _make_name_servers(
+    args: dict[str, Any],
+) -> tuple[dns.name.Name, frozenset[dns.name.Name]] | None:
     try:
         name_servers = json.loads(args[ARG_NAME_SERVERS])
     except json.JSONDecodeError as ex:
@@ -195,7 +208,7 @@ def _make_name_servers(args: dict[str, Any]) -> tuple[str, frozenset[str]] | Non
             logging.error("Name server '%s' is not a valid FQDN: %s", ns, error)
             return None
 
-        abs_name_servers.append(f"{ns}.")
+        abs_name_servers.append(dns.name.from_text(ns, origin=dns.name.root))
 
     return (abs_name_servers[0], frozenset(abs_name_servers))
 
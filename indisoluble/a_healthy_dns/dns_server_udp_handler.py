@@ -6,6 +6,7 @@ Handles incoming DNS queries over UDP, processes them against the configured
 zone, and returns appropriate DNS responses with authoritative answers.
 """
 
+import functools
 import logging
 import socketserver
 
@@ -226,7 +227,7 @@ def _classify_query(
     if origin_name is None:
         return _make_refused_outcome(question, query_id, client_address)
 
-    relative_name = zone_origins.relativize(query_name)
+    relative_name = query_name.relativize(origin_name)
 
     with zone.reader() as txn:
         node = txn.get_node(relative_name)
@@ -289,7 +290,7 @@ def _is_empty_non_terminal(
     empty non-terminal response contract (RFC 4592 / RFC 8020).
     """
 
-    return any(name.is_subdomain(query_name) for name in txn.iterate_names())
+    return query_name in _names_with_descendants(txn.version)
 
 
 def _log_query(
@@ -300,6 +301,10 @@ def _log_query(
     client_address: tuple[str, int],
     answer_count: int | None = None,
 ) -> None:
+    # Called for every query: skip building the arguments when INFO is off
+    if not logging.root.isEnabledFor(logging.INFO):
+        return
+
     message = "%s %s: source=%s:%d id=%d qname=%s qtype=%s"
     args = (
         traffic_marker,
@@ -432,6 +437,16 @@ def _make_soa_authority_outcome(
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _names_with_descendants(version: dns.zone.Version) -> frozenset[dns.name.Name]:
+    # Versions are immutable once committed, so index each one only once
+    return frozenset(
+        dns.name.Name(name.labels[index:])
+        for name in version.keys()
+        for index in range(1, len(name))
+    )
+
+
 def _parse_query(data: bytes, client_address: tuple[str, int]) -> dns.message.Message:
     try:
         return dns.message.from_wire(data)
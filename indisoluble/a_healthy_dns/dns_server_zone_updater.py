@@ -8,17 +8,19 @@ handles DNSSEC signing, and maintains zone freshness with configurable intervals
 
 import datetime
 import logging
+import math
 
 import dns.dnssec
 import dns.name
 import dns.transaction
 import dns.versioned
 
-from enum import auto, Enum
+from concurrent.futures import ThreadPoolExecutor, wait
 from functools import partial
-from typing import Callable, Iterator, NamedTuple
+from typing import Callable, Iterable, Iterator, NamedTuple
 
 from indisoluble.a_healthy_dns.dns_server_config_factory import DnsServerConfig
+from indisoluble.a_healthy_dns.records.a_healthy_ip import AHealthyIp
 from indisoluble.a_healthy_dns.records.a_healthy_record import AHealthyRecord
 from indisoluble.a_healthy_dns.records.a_record import make_a_record
 from indisoluble.a_healthy_dns.records.dnssec import ExtendedRRSigKey, iter_rrsig_key
@@ -27,14 +29,6 @@ from indisoluble.a_healthy_dns.records.soa_record import iter_soa_record
 from indisoluble.a_healthy_dns.tools.can_create_connection import can_create_connection
 
 
-class RefreshARecordsResult(Enum):
-    """Result states for A record refresh operations."""
-
-    NO_CHANGES = auto()
-    CHANGES = auto()
-    ABORTED = auto()
-
-
 class RRSigAction(NamedTuple):
     """DNSSEC signature action containing resign time and key iterator."""
 
@@ -45,11 +39,22 @@ class RRSigAction(NamedTuple):
 ShouldAbortOp = Callable[[], bool]
 
 
+_ABORT_POLL_INTERVAL = 0.1
 _DELTA_PER_RECORD_SIGN = 2
+_MAX_PROBE_WORKERS = 32
 
 DELTA_PER_RECORD_MANAGEMENT = 1
 
 
+def _health_probes(a_records: Iterable[AHealthyRecord]) -> set[tuple[str, int]]:
+    return {
+        (health_ip.ip, health_ip.health_port)
+        for a_record in a_records
+        for health_ip in a_record.healthy_ips
+        if health_ip.health_port is not None
+    }
+
+
 def _calculate_max_interval(
     min_interval: int,
     connection_timeout: int,
@@ -59,11 +64,10 @@ def _calculate_max_interval(
     delta_per_record = DELTA_PER_RECORD_MANAGEMENT + (
         _DELTA_PER_RECORD_SIGN if do_sign else 0
     )
-    max_loop_duration = sum(
-        sum(1 for ip in record.healthy_ips if ip.health_port is not None)
-        * connection_timeout
-        + delta_per_record
-        for record in a_records
+    # Distinct probes run concurrently, one connection timeout per pool round
+    probe_rounds = math.ceil(len(_health_probes(a_records)) / _MAX_PROBE_WORKERS)
+    max_loop_duration = (
+        probe_rounds * connection_timeout + len(a_records) * delta_per_record
     )
 
     return max_loop_duration if max_loop_duration > min_interval else min_interval
@@ -106,8 +110,8 @@ class DnsServerZoneUpdater:
             if config.ext_private_key
             else None
         )
-        self._a_recs = list(config.a_records)
-        self._make_a_record = partial(make_a_record, max_interval)
+        self._a_recs = tuple(config.a_records)
+        self._max_interval = max_interval
         self._can_create_connection = partial(
             can_create_connection, timeout=float(connection_timeout)
         )
@@ -115,19 +119,10 @@ class DnsServerZoneUpdater:
         self._zone = dns.versioned.Zone(config.zone_origins.primary)
         self._is_zone_recreated_at_least_once = False
 
-    def _clear_zone(self, txn: dns.transaction.Transaction) -> None:
-        logging.debug("Clearing zone...")
-
-        for name in list(txn.iterate_names()):
-            logging.debug("Deleting node %s...", name)
-            txn.delete(name)
-
-        logging.debug("Zone cleared")
-
     def _add_a_record_to_zone(
         self, a_record: AHealthyRecord, txn: dns.transaction.Transaction
     ) -> None:
-        dataset = self._make_a_record(a_record)
+        dataset = make_a_record(self._max_interval, a_record)
         if dataset:
             txn.add(a_record.subdomain, dataset)
             logging.debug("Added A record %s to zone", a_record.subdomain)
@@ -168,75 +163,120 @@ class DnsServerZoneUpdater:
             resign=ext_rrsig_key.resign, iter=self._rrsig_action.iter
         )
 
-    def _is_zone_sign_near_to_expire(self) -> bool:
-        return (
-            datetime.datetime.now(datetime.timezone.utc) >= self._rrsig_action.resign
-            if self._rrsig_action
-            else False
+    def _is_zone_sign_near_to_expire(self, now: datetime.datetime) -> bool:
+        return now >= self._rrsig_action.resign if self._rrsig_action else False
+
+    def _probe_health_ports(
+        self, should_abort: ShouldAbortOp
+    ) -> dict[tuple[str, int], bool] | None:
+        # Backends shared by several records are probed once per cycle
+        probes = _health_probes(self._a_recs)
+        if not probes:
+            return {}
+
+        probe_pool = ThreadPoolExecutor(
+            max_workers=min(_MAX_PROBE_WORKERS, len(probes)),
+            thread_name_prefix="HealthProbe",
         )
+        try:
+            futures = {
+                probe_pool.submit(self._can_create_connection, *probe): probe
+                for probe in probes
+            }
+
+            pending = set(futures)
+            while pending:
+                if should_abort():
+                    logging.debug("Abort health checks. Keep A records as they are")
+                    return None
+
+                _, pending = wait(pending, timeout=_ABORT_POLL_INTERVAL)
+
+            return {probe: future.result() for future, probe in futures.items()}
+        finally:
+            # Probes already connecting finish within the connection timeout
+            probe_pool.shutdown(wait=True, cancel_futures=True)
+
+    def _check_ip(
+        self, health_ip: AHealthyIp, probe_results: dict[tuple[str, int], bool]
+    ) -> AHealthyIp:
+        if health_ip.health_port is None:
+            logging.debug(
+                "IP %s has no health port; publishing as standard static entry",
+                health_ip.ip,
+            )
+            return health_ip.updated_status(True)
+
+        is_healthy = probe_results[(health_ip.ip, health_ip.health_port)]
+        logging.debug(
+            "Checked IP %s on port %s: from %s to %s",
+            health_ip.ip,
+            health_ip.health_port,
+            health_ip.is_healthy,
+            is_healthy,
+        )
+        return health_ip.updated_status(is_healthy)
 
     def _refresh_a_record(
-        self, a_record: AHealthyRecord, should_abort: ShouldAbortOp
-    ) -> AHealthyRecord | None:
+        self, a_record: AHealthyRecord, probe_results: dict[tuple[str, int], bool]
+    ) -> AHealthyRecord:
         logging.debug("Checking A record %s ...", a_record.subdomain)
 
-        updated_ips = []
-        for health_ip in a_record.healthy_ips:
-            if should_abort():
-                logging.debug("Abort record check. Keep A record as it is")
-                return None
-
-            if health_ip.health_port is None:
-                is_healthy = True
-                logging.debug(
-                    "IP %s has no health port; publishing as standard static entry",
-                    health_ip.ip,
-                )
-            else:
-                is_healthy = self._can_create_connection(health_ip.ip, health_ip.health_port)
-                logging.debug(
-                    "Checked IP %s on port %s: from %s to %s",
-                    health_ip.ip,
-                    health_ip.health_port,
-                    health_ip.is_healthy,
-                    is_healthy,
-                )
-            checked_ip = health_ip.updated_status(is_healthy)
-
-            updated_ips.append(checked_ip)
+        updated_ips = [
+            self._check_ip(health_ip, probe_results)
+            for health_ip in a_record.healthy_ips
+        ]
 
         logging.debug("A record %s checked", a_record.subdomain)
 
         return a_record.updated_ips(updated_ips)
 
-    def _refresh_a_recs(self, should_abort: ShouldAbortOp) -> RefreshARecordsResult:
-        checked_a_recs = []
+    def _refresh_a_recs(
+        self, should_abort: ShouldAbortOp
+    ) -> list[AHealthyRecord] | None:
+        probe_results = self._probe_health_ports(should_abort)
+        if probe_results is None:
+            logging.debug("Zone updater stopped. No A record updated")
+            return None
+
+        checked_a_recs = tuple(
+            self._refresh_a_record(a_record, probe_results)
+            for a_record in self._a_recs
+        )
 
-        are_there_any_changes = False
-        for a_record in self._a_recs:
-            checked_record = self._refresh_a_record(a_record, should_abort)
-            if checked_record is None:
-                logging.debug("Zone updater stopped. No A record updated")
-                return RefreshARecordsResult.ABORTED
+        changed_a_recs = [
+            checked_record
+            for checked_record, a_record in zip(checked_a_recs, self._a_recs)
+            if checked_record.healthy_ips != a_record.healthy_ips
+        ]
 
-            checked_a_recs.append(checked_record)
+        self._a_recs = checked_a_recs
 
-            are_there_any_changes = (
-                are_there_any_changes
-                or checked_record.healthy_ips != a_record.healthy_ips
-            )
+        return changed_a_recs
 
-        self._a_recs = checked_a_recs
+    def _patch_zone(self, changed_a_recs: list[AHealthyRecord]) -> None:
+        logging.debug("Patching %d A records in zone...", len(changed_a_recs))
 
-        return (
-            RefreshARecordsResult.CHANGES
-            if are_there_any_changes
-            else RefreshARecordsResult.NO_CHANGES
-        )
+        with self._zone.writer() as txn:
+            txn.replace(dns.name.empty, next(self._soa_rec))
+            logging.debug("Replaced SOA record in zone")
+
+            # Same per-record log lines as the rebuild path
+            for a_record in changed_a_recs:
+                dataset = make_a_record(self._max_interval, a_record)
+                if dataset:
+                    txn.replace(a_record.subdomain, dataset)
+                    logging.debug("Added A record %s to zone", a_record.subdomain)
+                else:
+                    # Unsigned subdomain nodes hold nothing but the A rdataset
+                    txn.delete(a_record.subdomain)
+                    logging.debug("A record %s skipped", a_record.subdomain)
+
+        logging.debug("Zone patched")
 
     def initialize_zone(self) -> None:
-        with self._zone.writer() as txn:
-            self._clear_zone(txn)
+        # Replacement writers start from an empty version: no per-name deletes
+        with self._zone.writer(replacement=True) as txn:
             self._add_records_to_zone(txn)
             self._sign_zone(txn)
 
@@ -244,19 +284,27 @@ class DnsServerZoneUpdater:
 
     def update(self, *, should_abort: ShouldAbortOp = lambda: False) -> None:
         """Run health checks and update the zone when IP health status changes."""
-        refresh_result = self._refresh_a_recs(should_abort)
-        if refresh_result == RefreshARecordsResult.ABORTED:
+        changed_a_recs = self._refresh_a_recs(should_abort)
+        if changed_a_recs is None:
             logging.info("Zone updater stopped. Keep zone as it is")
             return
 
-        do_update_zone = refresh_result == RefreshARecordsResult.CHANGES
+        do_update_zone = bool(changed_a_recs)
         if do_update_zone:
             logging.info("A records changed")
 
-        if self._is_zone_sign_near_to_expire():
+        # One clock reading per cycle keeps the signing decision deterministic
+        now = datetime.datetime.now(datetime.timezone.utc)
+        if self._is_zone_sign_near_to_expire(now):
             logging.info("Zone signing is near to expire")
             do_update_zone = True
 
-        if do_update_zone or not self._is_zone_recreated_at_least_once:
+        if not self._is_zone_recreated_at_least_once or (
+            do_update_zone and self._rrsig_action
+        ):
+            # Signatures and NSEC chain cover the whole zone: rebuild and re-sign
             logging.info("Updating zone...")
             self.initialize_zone()
+        elif do_update_zone:
+            logging.info("Updating zone...")
+            self._patch_zone(changed_a_recs)
@@ -18,6 +18,8 @@ from indisoluble.a_healthy_dns.tools.normalize_ip import normalize_ip
 class AHealthyIp:
     """IP address value object with health status and optional health port."""
 
+    __slots__ = ("_hash", "_health_port", "_ip", "_is_healthy")
+
     @property
     def ip(self) -> str:
         """Get the normalized IP address."""
@@ -44,9 +46,7 @@ class AHealthyIp:
             if not success:
                 raise ValueError(f"Invalid port: {error}")
 
-        self._ip = normalize_ip(ip)
-        self._health_port = health_port
-        self._is_healthy = is_healthy
+        self._set_fields(normalize_ip(ip), health_port, is_healthy)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, AHealthyIp):
@@ -59,7 +59,7 @@ class AHealthyIp:
         )
 
     def __hash__(self) -> int:
-        return hash((self.ip, self.health_port, self.is_healthy))
+        return self._hash
 
     def __repr__(self) -> str:
         return (
@@ -67,11 +67,26 @@ class AHealthyIp:
             f"is_healthy={self.is_healthy})"
         )
 
+    @classmethod
+    def _from_validated(
+        cls, ip: str, health_port: int | None, is_healthy: bool
+    ) -> AHealthyIp:
+        # Skips __init__: fields must already be validated and normalized
+        healthy_ip = object.__new__(cls)
+        healthy_ip._set_fields(ip, health_port, is_healthy)
+        return healthy_ip
+
+    def _set_fields(self, ip: str, health_port: int | None, is_healthy: bool) -> None:
+        self._ip = ip
+        self._health_port = health_port
+        self._is_healthy = is_healthy
+        # Fields are immutable, so hash once instead of on every set lookup
+        self._hash = hash((ip, health_port, is_healthy))
+
     def updated_status(self, is_healthy: bool) -> AHealthyIp:
         """Return new instance with updated health status if changed."""
         if is_healthy == self._is_healthy:
             return self
 
-        return AHealthyIp(
-            ip=self.ip, health_port=self.health_port, is_healthy=is_healthy
-        )
+        # IP and port were validated and normalized when self was built
+        return self._from_validated(self._ip, self._health_port, is_healthy)
@@ -10,6 +10,8 @@ from __future__ import annotations
 
 import dns.name
 
+from typing import Iterable
+
 from indisoluble.a_healthy_dns.records.a_healthy_ip import AHealthyIp
 
 
@@ -26,8 +28,13 @@ class AHealthyRecord:
         """Get the set of healthy IP addresses for this record."""
         return self._healthy_ips
 
-    def __init__(self, subdomain: dns.name.Name, healthy_ips: list[AHealthyIp]) -> None:
-        """Initialize healthy A record with subdomain and IP list."""
+    def __init__(
+        self, subdomain: dns.name.Name, healthy_ips: Iterable[AHealthyIp]
+    ) -> None:
+        """Initialize healthy A record with subdomain and IPs.
+
+        A frozenset argument is stored as is, without being copied.
+        """
         self._subdomain = subdomain
         self._healthy_ips = frozenset(healthy_ips)
 
@@ -45,9 +52,11 @@ class AHealthyRecord:
 
         return f"AHealthyRecord(subdomain={self.subdomain}, healthy_ips=[{ips_str}])"
 
-    def updated_ips(self, updated_ips: list[AHealthyIp]) -> AHealthyRecord:
-        """Return new record with updated IP list if changed."""
-        if frozenset(updated_ips) == self.healthy_ips:
+    def updated_ips(self, updated_ips: Iterable[AHealthyIp]) -> AHealthyRecord:
+        """Return new record with updated IPs if changed."""
+        healthy_ips = frozenset(updated_ips)
+        if healthy_ips == self.healthy_ips:
             return self
 
-        return AHealthyRecord(subdomain=self.subdomain, healthy_ips=updated_ips)
+        # Hand over the set just built so the new record does not hash it again
+        return AHealthyRecord(subdomain=self.subdomain, healthy_ips=healthy_ips)
@@ -11,6 +11,7 @@ import logging
 import dns.rdataclass
 import dns.rdataset
 import dns.rdatatype
+import dns.rdtypes.IN.A
 
 from indisoluble.a_healthy_dns.records.a_healthy_record import AHealthyRecord
 from indisoluble.a_healthy_dns.records.time import calculate_a_ttl
@@ -26,7 +27,10 @@ def make_a_record(
         return None
 
     ttl = calculate_a_ttl(max_interval)
-    rdataset = dns.rdataset.from_text(dns.rdataclass.IN, dns.rdatatype.A, ttl, *ips)
+    rdataset = dns.rdataset.from_rdata_list(
+        ttl,
+        [dns.rdtypes.IN.A.A(dns.rdataclass.IN, dns.rdatatype.A, ip) for ip in ips],
+    )
     logging.debug("Created A record with ttl: %d, and IPs: %s", ttl, ips)
 
     return rdataset
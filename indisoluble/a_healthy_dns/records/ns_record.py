@@ -8,20 +8,26 @@ intervals and zone update frequency.
 
 import logging
 
+import dns.name
 import dns.rdataclass
 import dns.rdataset
 import dns.rdatatype
+import dns.rdtypes.ANY.NS
 
 from indisoluble.a_healthy_dns.records.time import calculate_ns_ttl
 
 
 def make_ns_record(
-    max_interval: int, name_servers: frozenset[str]
+    max_interval: int, name_servers: frozenset[dns.name.Name]
 ) -> dns.rdataset.Rdataset:
     """Create DNS NS record with calculated TTL for given name servers."""
     ttl = calculate_ns_ttl(max_interval)
-    rdataset = dns.rdataset.from_text(
-        dns.rdataclass.IN, dns.rdatatype.NS, ttl, *name_servers
+    rdataset = dns.rdataset.from_rdata_list(
+        ttl,
+        [
+            dns.rdtypes.ANY.NS.NS(dns.rdataclass.IN, dns.rdatatype.NS, name_server)
+            for name_server in name_servers
+        ],
     )
     logging.debug(
         "Created NS record with ttl: %d, and name servers: %s", ttl, name_servers
@@ -13,6 +13,7 @@ import dns.name
 import dns.rdataclass
 import dns.rdataset
 import dns.rdatatype
+import dns.rdtypes.ANY.SOA
 
 from typing import Iterator
 
@@ -44,34 +45,33 @@ def _iter_soa_serial() -> Iterator[int]:
 
 
 def iter_soa_record(
-    max_interval: int, origin_name: dns.name.Name, primary_ns: str
+    max_interval: int, origin_name: dns.name.Name, primary_ns: dns.name.Name
 ) -> Iterator[dns.rdataset.Rdataset]:
     """Generate SOA records with dynamic serial numbers and timing parameters."""
     ttl = calculate_soa_ttl(max_interval)
-    responsible = f"hostmaster.{origin_name}"
+    # Names and timers are fixed for the zone: only the serial changes per record
+    rname = dns.name.from_text("hostmaster", origin=origin_name)
     serial = _iter_soa_serial()
-    refresh = str(calculate_soa_refresh(max_interval))
-    retry = str(calculate_soa_retry(max_interval))
-    expire = str(calculate_soa_expire(max_interval))
-    min_ttl = str(calculate_soa_min_ttl(max_interval))
+    refresh = calculate_soa_refresh(max_interval)
+    retry = calculate_soa_retry(max_interval)
+    expire = calculate_soa_expire(max_interval)
+    min_ttl = calculate_soa_min_ttl(max_interval)
 
     while True:
-        admin_info = " ".join(
-            [
-                primary_ns,
-                responsible,
-                str(next(serial)),
-                refresh,
-                retry,
-                expire,
-                min_ttl,
-            ]
-        )
-        rdataset = dns.rdataset.from_text(
-            dns.rdataclass.IN, dns.rdatatype.SOA, ttl, admin_info
+        soa_rdata = dns.rdtypes.ANY.SOA.SOA(
+            dns.rdataclass.IN,
+            dns.rdatatype.SOA,
+            primary_ns,
+            rname,
+            next(serial),
+            refresh,
+            retry,
+            expire,
+            min_ttl,
         )
+        rdataset = dns.rdataset.from_rdata(ttl, soa_rdata)
         logging.debug(
-            "Created SOA record with ttl: %d, and admin info: %s", ttl, admin_info
+            "Created SOA record with ttl: %d, and admin info: %s", ttl, soa_rdata
         )
 
         yield rdataset
@@ -9,6 +9,11 @@ from typing import Any
 from indisoluble.a_healthy_dns.tools.is_valid_subdomain import is_valid_subdomain
 
 
+def _folded_labels(name: dns.name.Name) -> tuple[bytes, ...]:
+    # DNS names compare case-insensitively in ASCII, as bytes.lower() does
+    return tuple(label.lower() for label in name.labels)
+
+
 def _to_abs_name(raw_name: Any) -> dns.name.Name:
     success, error = is_valid_subdomain(raw_name)
     if not success:
@@ -35,6 +40,14 @@ class ZoneOrigins:
             key=lambda zone: (-len(zone), zone.to_text()),
         )
 
+        # Match by suffix lookup instead of comparing against every origin
+        self._origins_by_labels = {
+            _folded_labels(origin): origin for origin in self._origins
+        }
+        self._origin_lengths = sorted(
+            {len(origin) for origin in self._origins}, reverse=True
+        )
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ZoneOrigins):
             return False
@@ -55,14 +68,11 @@ class ZoneOrigins:
         if not name.is_absolute():
             return self._primary
 
-        return next(
-            (origin for origin in self._origins if name.is_subdomain(origin)), None
-        )
-
-    def relativize(self, name: dns.name.Name) -> dns.name.Name | None:
-        """Return relative name using matching origin, or None when unmatched."""
-        if not name.is_absolute():
-            return name
+        labels = _folded_labels(name)
+        for length in self._origin_lengths:
+            if length <= len(labels):
+                origin = self._origins_by_labels.get(labels[-length:])
+                if origin is not None:
+                    return origin
 
-        origin = self.origin_for(name)
-        return None if origin is None else name.relativize(origin)
+        return None
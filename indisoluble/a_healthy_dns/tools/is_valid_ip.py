@@ -6,19 +6,37 @@ Provides functions to validate IPv4 addresses by checking octet format
 and numeric ranges.
 """
 
+import functools
+
 from typing import Any
 
 
-def is_valid_ip(ip: Any) -> tuple[bool, str]:
-    """Validate IPv4 address format and octet ranges."""
-    if not isinstance(ip, str):
-        return (False, "It must be a string")
+_CACHE_SIZE = 4096
+_MAX_OCTET_VALUE = 255
 
-    parts = ip.split(".")
-    if len(parts) != 4:
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _is_valid_ip_text(ip: str) -> tuple[bool, str]:
+    # Count separators before splitting so oversized inputs are not split
+    if ip.count(".") != 3:
         return (False, "IP address must have 4 octets")
 
-    if not all(part.isdigit() and (0 <= int(part) <= 255) for part in parts):
+    parts = ip.split(".")
+
+    # isdigit() alone also accepts non-ASCII digits such as fullwidth ones
+    if not all(
+        part.isascii() and part.isdigit() and int(part) <= _MAX_OCTET_VALUE
+        for part in parts
+    ):
         return (False, "Each octet must be a number between 0 and 255")
 
     return (True, "")
+
+
+def is_valid_ip(ip: Any) -> tuple[bool, str]:
+    """Validate IPv4 address format and octet ranges."""
+    if not isinstance(ip, str):
+        return (False, "It must be a string")
+
+    # Only strings are cached: other inputs may be unhashable
+    return _is_valid_ip_text(ip)
@@ -6,17 +6,18 @@ Provides functions to validate DNS subdomain names according to basic
 DNS naming rules and character restrictions.
 """
 
+import re
+
 from typing import Any
 
+
+# Non-empty ASCII letter/digit/hyphen labels separated by single dots
+_ASCII_LDH_NAME_RE = re.compile(r"[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*")
+# 1-63 ASCII letter/digit/hyphen characters, starting and ending alphanumeric
+_LDH_LABEL = r"[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?"
 _MAX_DNS_LABEL_LENGTH = 63
 _MAX_DNS_NAME_LENGTH = 253
-_ASCII_LABEL_CHARS = frozenset(
-    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-"
-)
-
-
-def _is_ascii_ldh_label(label: str) -> bool:
-    return all(char in _ASCII_LABEL_CHARS for char in label)
+_VALID_LDH_NAME_RE = re.compile(rf"{_LDH_LABEL}(?:\.{_LDH_LABEL})*")
 
 
 def is_valid_subdomain(name: Any, origin_name: str = "") -> tuple[bool, str]:
@@ -33,24 +34,27 @@ def is_valid_subdomain(name: Any, origin_name: str = "") -> tuple[bool, str]:
     if len(name) > _MAX_DNS_NAME_LENGTH:
         return (False, f"It must be {_MAX_DNS_NAME_LENGTH} characters or fewer")
 
-    absolute_name = f"{name}.{origin_name}" if origin_name else name
-    if len(absolute_name) > _MAX_DNS_NAME_LENGTH:
+    # Length of "<name>.<origin_name>", computed without building the string
+    absolute_length = len(name) + len(origin_name) + 1 if origin_name else len(name)
+    if absolute_length > _MAX_DNS_NAME_LENGTH:
         return (
             False,
             f"It must be {_MAX_DNS_NAME_LENGTH} characters or fewer with the origin",
         )
 
-    labels = name.split(".")
-    if not all(label and _is_ascii_ldh_label(label) for label in labels):
+    # Valid names are accepted in one scan; the checks below explain failures
+    if _VALID_LDH_NAME_RE.fullmatch(name):
+        return (True, "")
+
+    if not _ASCII_LDH_NAME_RE.fullmatch(name):
         return (False, "Labels must contain only ASCII letters, digits, or hyphens")
 
+    labels = name.split(".")
     if not all(len(label) <= _MAX_DNS_LABEL_LENGTH for label in labels):
         return (False, f"Labels must be {_MAX_DNS_LABEL_LENGTH} characters or fewer")
 
-    if not all(label[0].isalnum() and label[-1].isalnum() for label in labels):
-        return (False, "Labels must start and end with an ASCII letter or digit")
-
-    return (True, "")
+    # Only the first/last character rule is left to explain the mismatch
+    return (False, "Labels must start and end with an ASCII letter or digit")
 
 
 def is_valid_fqdn(name: Any) -> tuple[bool, str]:
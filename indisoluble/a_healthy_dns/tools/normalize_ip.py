@@ -6,9 +6,17 @@ Provides functions to normalize IPv4 addresses by removing leading zeros
 from octets while preserving valid format.
 """
 
+import re
+
+
+_LEADING_ZERO_RE = re.compile(r"(?:^|\.)0[0-9]")
+
 
 def normalize_ip(ip_address: str) -> str:
     """Normalize IPv4 address by removing leading zeros from octets."""
+    if not _LEADING_ZERO_RE.search(ip_address):
+        return ip_address  # Already canonical, skip split and re-join
+
     octets = ip_address.split(".")
     normalized_octets = [octet.lstrip("0") or "0" for octet in octets]
 
@@ -2,6 +2,8 @@
 
 import pytest
 
+from unittest.mock import patch
+
 from indisoluble.a_healthy_dns.records.a_healthy_ip import AHealthyIp
 
 _IP = "192.168.1.1"
@@ -154,6 +156,21 @@ class TestAHealthyIpStatusUpdates:
         _assert_ip_state(updated_ip, is_healthy=False)
         assert healthy_ip.is_healthy is True
 
+    def test_updated_status_does_not_revalidate_fields(self):
+        healthy_ip = _make_ip(ip=_NON_NORMALIZED_IP, is_healthy=True)
+
+        with patch(
+            "indisoluble.a_healthy_dns.records.a_healthy_ip.is_valid_ip"
+        ) as mock_is_valid_ip, patch(
+            "indisoluble.a_healthy_dns.records.a_healthy_ip.is_valid_port"
+        ) as mock_is_valid_port:
+            updated_ip = healthy_ip.updated_status(False)
+
+        mock_is_valid_ip.assert_not_called()
+        mock_is_valid_port.assert_not_called()
+        _assert_ip_state(updated_ip, is_healthy=False)
+        assert hash(updated_ip) == hash(_make_ip(is_healthy=False))
+
     def test_updated_status_preserves_none_health_port(self):
         healthy_ip = _make_ip(health_port=None, is_healthy=True)
 
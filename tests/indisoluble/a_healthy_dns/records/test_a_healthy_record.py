@@ -35,6 +35,18 @@ class TestAHealthyRecordInitialization:
 
         _assert_record_state(record, healthy_ips=healthy_ips)
 
+    def test_init_keeps_frozenset_of_ips_without_copying(self):
+        healthy_ips = frozenset(
+            [
+                _make_ip("192.168.1.1", 80, True),
+                _make_ip("192.168.1.2", 80, True),
+            ]
+        )
+
+        record = _make_record(healthy_ips=healthy_ips)
+
+        assert record.healthy_ips is healthy_ips
+
 
 class TestAHealthyRecordEqualityAndHashing:
     def test_equal_when_subdomain_matches_regardless_of_ip_state(self):
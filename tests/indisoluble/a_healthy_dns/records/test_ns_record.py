@@ -15,9 +15,7 @@ def _assert_ns_rdataset(rdataset, *, ttl, name_servers):
     assert rdataset.rdtype == dns.rdatatype.NS
     assert rdataset.rdclass == dns.rdataclass.IN
 
-    assert {rdata.target for rdata in rdataset} == {
-        dns.name.from_text(name_server, origin=None) for name_server in name_servers
-    }
+    assert {rdata.target for rdata in rdataset} == name_servers
 
 
 class TestNsRecordGeneration:
@@ -26,12 +24,17 @@ class TestNsRecordGeneration:
         [
             (
                 60,
-                frozenset(["ns1.example.com", "ns2.example.com"]),
+                frozenset(
+                    [
+                        dns.name.from_text("ns1.example.com"),
+                        dns.name.from_text("ns2.example.com"),
+                    ]
+                ),
                 3600,
             ),
             (
                 45,
-                frozenset(["ns1.example.com"]),
+                frozenset([dns.name.from_text("ns1.example.com")]),
                 2700,
             ),
         ],
@@ -50,7 +53,7 @@ class TestNsRecordGeneration:
 
     def test_caps_ttl_to_rfc8767_max(self):
         max_interval = 100_000_000
-        name_servers = frozenset(["ns1.example.com"])
+        name_servers = frozenset([dns.name.from_text("ns1.example.com")])
 
         result = make_ns_record(max_interval, name_servers)
 
@@ -14,7 +14,7 @@ from indisoluble.a_healthy_dns.records.time import _RFC8767_MAX_TTL as RFC8767_M
 
 _MAX_INTERVAL = 60
 _ORIGIN_NAME = dns.name.from_text("example.com")
-_PRIMARY_NS = "ns1.example.com."
+_PRIMARY_NS = dns.name.from_text("ns1.example.com.")
 _SERIAL = 1234567890
 
 
@@ -46,7 +46,7 @@ class TestSoaRecordGeneration:
         soa_rdata = _soa_rdata(result)
 
         _assert_soa_rdataset(result, ttl=3600)
-        assert soa_rdata.mname == dns.name.from_text(_PRIMARY_NS)
+        assert soa_rdata.mname == _PRIMARY_NS
         assert soa_rdata.rname == dns.name.from_text(f"hostmaster.{_ORIGIN_NAME}")
         assert soa_rdata.serial == _SERIAL
         assert soa_rdata.refresh == 1200
@@ -77,6 +77,9 @@ class TestZoneOriginMatching:
             ("www.example.com", _PRIMARY),
             ("www.alias.com", _ALIAS),
             ("api.dev.example.com", "dev.example.com"),
+            ("example.com", _PRIMARY),
+            ("WWW.Example.COM", _PRIMARY),
+            ("Api.DEV.example.com", "dev.example.com"),
         ],
     )
     def test_absolute_name_matches_hosted_or_alias_origin(self, qname, expected_origin):
@@ -84,38 +87,13 @@ class TestZoneOriginMatching:
 
         assert origins.origin_for(_abs_name(qname)) == _abs_name(expected_origin)
 
-    def test_unmatched_absolute_name_returns_none(self):
-        origins = _origins(aliases=[_ALIAS])
-
-        assert origins.origin_for(_abs_name("www.other.com")) is None
-
-
-class TestZoneOriginRelativization:
-    def test_relative_name_is_returned_as_is(self):
-        origins = _origins()
-        relative_name = _rel_name("www")
-
-        assert origins.relativize(relative_name) == relative_name
-
     @pytest.mark.parametrize(
-        "qname,expected_relative_name",
-        [
-            ("www.example.com", "www"),
-            ("www.alias.com", "www"),
-            ("api.dev.example.com", "api"),
-        ],
+        "qname", ["www.other.com", "www.notexample.com", "com", "a.b.c.d.e.f"]
     )
-    def test_absolute_name_under_hosted_or_alias_origin_is_relativized(
-        self, qname, expected_relative_name
-    ):
-        origins = _origins(aliases=[_ALIAS, "dev.example.com"])
-
-        assert origins.relativize(_abs_name(qname)) == _rel_name(expected_relative_name)
-
-    def test_unmatched_absolute_name_returns_none(self):
+    def test_unmatched_absolute_name_returns_none(self, qname):
         origins = _origins(aliases=[_ALIAS])
 
-        assert origins.relativize(_abs_name("www.other.com")) is None
+        assert origins.origin_for(_abs_name(qname)) is None
 
 
 class TestZoneOriginsEqualityAndHashing:
@@ -40,8 +40,8 @@ def live_server():
     )
     config = DnsServerConfig(
         zone_origins=zone_origins,
-        primary_name_server=s.NS,
-        name_servers=frozenset([s.NS]),
+        primary_name_server=dns.name.from_text(s.NS),
+        name_servers=frozenset([dns.name.from_text(s.NS)]),
         a_records=frozenset([a_record, nested_record]),
         ext_private_key=None,
     )
@@ -95,11 +95,20 @@ class FakeReaderContext:
         return False
 
 
+class FakeVersion:
+    def __init__(self, names):
+        self._names = names
+
+    def keys(self):
+        return iter(self._names)
+
+
 class FakeTransaction:
     def __init__(self, *, nodes=None, soa_rdataset=None, names=None):
         self._nodes = nodes or {}
         self._soa_rdataset = soa_rdataset
         self._names = list(self._nodes) if names is None else list(names)
+        self.version = FakeVersion(self._names)
 
     def get_node(self, name):
         return self._nodes.get(name)
@@ -110,9 +119,6 @@ class FakeTransaction:
 
         return None
 
-    def iterate_names(self):
-        return iter(self._names)
-
 
 class FakeZone:
     rdclass = dns.rdataclass.IN
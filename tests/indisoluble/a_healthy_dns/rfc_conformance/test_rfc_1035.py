@@ -301,8 +301,8 @@ class TestUdpSerialization:
         )
         config = DnsServerConfig(
             zone_origins=zone_origins,
-            primary_name_server="ns1.example.net.",
-            name_servers=frozenset(["ns1.example.net."]),
+            primary_name_server=dns.name.from_text("ns1.example.net."),
+            name_servers=frozenset([dns.name.from_text("ns1.example.net.")]),
             a_records=frozenset([a_record]),
             ext_private_key=None,
         )
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import dns.flags
+import dns.message
 import dns.name
 import dns.rcode
 import dns.rdatatype
@@ -78,3 +79,48 @@ class TestOwnerNameExistence:
             name=zone_origins.primary,
             expected_ttl=next(iter(soa_rdataset)).minimum,
         )
+
+    def test_deeper_empty_non_terminal_matches_case_insensitively(
+        self, dns_response, zone_origins, soa_rdataset
+    ):
+        query_name = dns.name.from_text("TOP", origin=zone_origins.primary)
+        transaction = s.FakeTransaction(
+            soa_rdataset=soa_rdataset,
+            names=[dns.name.from_text("leaf.mid.top", origin=None)],
+        )
+        zone = s.make_zone(zone_origins, transaction)
+
+        s.update_test_response(
+            dns_response, query_name, dns.rdatatype.A, zone, zone_origins
+        )
+
+        assert dns_response.rcode() == dns.rcode.NOERROR
+        assert len(dns_response.answer) == 0
+
+    def test_empty_non_terminal_follows_the_active_zone_version(
+        self, zone_origins, soa_rdataset
+    ):
+        query_name = dns.name.from_text("empty", origin=zone_origins.primary)
+        versions = [
+            s.FakeTransaction(soa_rdataset=soa_rdataset, names=[]),
+            s.FakeTransaction(
+                soa_rdataset=soa_rdataset,
+                names=[dns.name.from_text("leaf.empty", origin=None)],
+            ),
+        ]
+
+        rcodes = []
+        for transaction in versions:
+            dns_response = dns.message.make_response(
+                dns.message.make_query("dummy", dns.rdatatype.A)
+            )
+            s.update_test_response(
+                dns_response,
+                query_name,
+                dns.rdatatype.A,
+                s.make_zone(zone_origins, transaction),
+                zone_origins,
+            )
+            rcodes.append(dns_response.rcode())
+
+        assert rcodes == [dns.rcode.NXDOMAIN, dns.rcode.NOERROR]
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import json
+import logging
 
 import dns.dnssectypes
 import dns.name
@@ -91,9 +92,12 @@ class TestMakeConfigSuccess:
             "dev.example.com", ["dev.alias-one.com", "dev.alias-two.com"]
         )
         assert config.name_servers == frozenset(
-            ["ns1.dns.example.net.", "ns2.dns.example.net."]
+            [
+                dns.name.from_text("ns1.dns.example.net"),
+                dns.name.from_text("ns2.dns.example.net"),
+            ]
         )
-        assert config.primary_name_server == "ns1.dns.example.net."
+        assert config.primary_name_server == dns.name.from_text("ns1.dns.example.net")
         assert _a_records_by_subdomain(config) == {
             _subdomain_name(config, "www"): frozenset(
                 [
@@ -132,6 +136,25 @@ class TestMakeConfigSuccess:
             )
         }
 
+    def test_logs_duplicate_ips_collapsed_after_normalization(self, valid_args, caplog):
+        valid_args[dscf.ARG_ZONE_RESOLUTIONS] = json.dumps(
+            {"dup": ["10.0.0.1", "10.0.0.1", "010.000.000.001", "10.0.0.2"]}
+        )
+
+        with caplog.at_level(logging.DEBUG):
+            config = dscf.make_config(valid_args)
+
+        assert config is not None
+        assert _a_records_by_subdomain(config) == {
+            _subdomain_name(config, "dup"): frozenset(
+                [
+                    AHealthyIp("10.0.0.1", None, False),
+                    AHealthyIp("10.0.0.2", None, False),
+                ]
+            )
+        }
+        assert "Collapsed 2 duplicate IPs in 'dup'" in caplog.text
+
 
 class TestMakeConfigDnssec:
     @patch(_LOAD_DNSSEC_PRIVATE_KEY)
@@ -373,6 +396,7 @@ class TestMakeConfigInputValidation:
                     }
                 }
             ),
+            json.dumps({"www": ["192.168.1.1"], "WWW": ["192.168.1.2"]}),
             json.dumps(
                 {
                     ".".join(["a" * 63, "b" * 63, "c" * 63, "d" * 61]): {
@@ -403,6 +427,7 @@ class TestMakeConfigInputValidation:
             "health-port-not-int",
             "negative-health-port",
             "health-port-too-large",
+            "subdomain-duplicated-ignoring-case",
             "subdomain-too-long-for-origin",
         ],
     )
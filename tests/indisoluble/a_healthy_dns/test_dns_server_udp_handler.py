@@ -5,6 +5,7 @@ import logging
 import dns.exception
 import dns.flags
 import dns.message
+import dns.name
 import dns.rcode
 import dns.rdatatype
 
@@ -80,3 +81,36 @@ class TestResponseConstructionFailure:
         assert f"source={s.TEST_SOURCE_HOST}:{s.TEST_SOURCE_PORT}" in caplog.text
         assert "problem=cannot build response" in caplog.text
         assert "Stack trace for DNS response construction failure" in caplog.text
+
+
+class TestQueryLogging:
+    @patch("dns.rdatatype.to_text")
+    def test_skips_formatting_query_log_when_info_is_disabled(
+        self, mock_to_text, caplog
+    ):
+        query, client_address, server = _make_handler_inputs()
+
+        with caplog.at_level(logging.WARNING):
+            s.handle_wire(query.to_wire(), client_address, server)
+
+        mock_to_text.assert_not_called()
+        assert "qname=" not in caplog.text
+
+    def test_logs_answered_query_when_info_is_enabled(self, caplog):
+        zone_origins = ZoneOrigins("example.com", [])
+        transaction = s.FakeTransaction(
+            nodes={
+                dns.name.from_text("test", origin=None): s.FakeNode(
+                    s.make_a_rdataset("192.0.2.1")
+                )
+            }
+        )
+        server = s.make_server(s.make_zone(zone_origins, transaction), zone_origins)
+        client_address = (s.TEST_SOURCE_HOST, s.TEST_SOURCE_PORT)
+        query = dns.message.make_query("test.example.com.", dns.rdatatype.A)
+
+        with caplog.at_level(logging.INFO):
+            s.handle_wire(query.to_wire(), client_address, server)
+
+        assert f"source={s.TEST_SOURCE_HOST}:{s.TEST_SOURCE_PORT}" in caplog.text
+        assert "qname=test.example.com. qtype=A answers=1" in caplog.text
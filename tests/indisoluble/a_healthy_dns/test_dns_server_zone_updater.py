@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+import datetime
+import logging
+
 import dns.dnssec
 import dns.name
 import dns.node
@@ -7,6 +10,7 @@ import dns.rdataset
 import dns.rdatatype
 import pytest
 
+from concurrent.futures import Future, wait
 from unittest.mock import Mock, call, patch
 
 from dns.dnssecalgs.rsa import PrivateRSASHA256
@@ -15,20 +19,28 @@ from indisoluble.a_healthy_dns.dns_server_config_factory import DnsServerConfig
 from indisoluble.a_healthy_dns.dns_server_zone_updater import DnsServerZoneUpdater
 from indisoluble.a_healthy_dns.records.a_healthy_ip import AHealthyIp
 from indisoluble.a_healthy_dns.records.a_healthy_record import AHealthyRecord
-from indisoluble.a_healthy_dns.records.dnssec import ExtendedPrivateKey
+from indisoluble.a_healthy_dns.records.dnssec import (
+    ExtendedPrivateKey,
+    iter_rrsig_key,
+)
 from indisoluble.a_healthy_dns.records.zone_origins import ZoneOrigins
 
 _MIN_INTERVAL = 30
 _CONNECTION_TIMEOUT = 5
 _MAKE_NS_RECORD = "indisoluble.a_healthy_dns.dns_server_zone_updater.make_ns_record"
 _ITER_SOA_RECORD = "indisoluble.a_healthy_dns.dns_server_zone_updater.iter_soa_record"
+_DATETIME = "indisoluble.a_healthy_dns.dns_server_zone_updater.datetime"
 _ITER_RRSIG_KEY = "indisoluble.a_healthy_dns.dns_server_zone_updater.iter_rrsig_key"
 _CAN_CREATE_CONNECTION = (
     "indisoluble.a_healthy_dns.dns_server_zone_updater.can_create_connection"
 )
+_THREAD_POOL_EXECUTOR = (
+    "indisoluble.a_healthy_dns.dns_server_zone_updater.ThreadPoolExecutor"
+)
 _UINT32_CURRENT_TIME = (
     "indisoluble.a_healthy_dns.records.soa_record.uint32_current_time"
 )
+_WAIT = "indisoluble.a_healthy_dns.dns_server_zone_updater.wait"
 
 
 def _get_rrsig_rdatasets(
@@ -106,6 +118,32 @@ def _connection_result_from_config(config, ip, port, timeout):
     ).is_healthy
 
 
+def _recording_iter_rrsig_key(drawn_keys):
+    def recording_iter_rrsig_key(max_interval, ext_private_key):
+        for ext_rrsig_key in iter_rrsig_key(max_interval, ext_private_key):
+            drawn_keys.append(ext_rrsig_key)
+            yield ext_rrsig_key
+
+    return recording_iter_rrsig_key
+
+
+class _FakeProbePool:
+    """Stand-in for the probe thread pool; probes run inline or never."""
+
+    def __init__(self, run_probes):
+        self.submitted = []
+        self.shutdown = Mock()
+        self._run_probes = run_probes
+
+    def submit(self, fn, *args):
+        self.submitted.append(args)
+        future = Future()
+        if self._run_probes:
+            future.set_result(fn(*args))
+
+        return future
+
+
 @pytest.fixture
 def zone_origins():
     return ZoneOrigins("example.com", [])
@@ -132,7 +170,10 @@ def a_record_ip_unhealthy(zone_origins):
 
 @pytest.fixture
 def name_servers():
-    return ["ns1.dns.example.net", "ns2.dns.example.net"]
+    return [
+        dns.name.from_text("ns1.dns.example.net"),
+        dns.name.from_text("ns2.dns.example.net"),
+    ]
 
 
 @pytest.fixture
@@ -297,7 +338,7 @@ class TestInitializationWiring:
         mock_make_ns_record.return_value = Mock()
         mock_iter_soa_record.return_value = iter([Mock()])
         mock_iter_rrsig_key.return_value = iter([Mock()])
-        expected_interval = 21
+        expected_interval = 11
 
         DnsServerZoneUpdater(
             min_interval=1,
@@ -317,6 +358,46 @@ class TestInitializationWiring:
             expected_interval, config_with_mock_dnssec.ext_private_key
         )
 
+    @pytest.mark.parametrize(
+        "subdomains, ip_count, expected_interval",
+        [
+            (["www", "api"], 1, _CONNECTION_TIMEOUT + 2),
+            (["www"], 32, _CONNECTION_TIMEOUT + 1),
+            (["www"], 33, 2 * _CONNECTION_TIMEOUT + 1),
+        ],
+        ids=["shared-backend-probed-once", "one-pool-round", "two-pool-rounds"],
+    )
+    @patch(_MAKE_NS_RECORD)
+    def test_charges_one_timeout_per_round_of_distinct_probes(
+        self,
+        mock_make_ns_record,
+        subdomains,
+        ip_count,
+        expected_interval,
+        zone_origins,
+        name_servers,
+    ):
+        a_records = [
+            AHealthyRecord(
+                subdomain=dns.name.from_text(subdomain, origin=zone_origins.primary),
+                healthy_ips=[
+                    AHealthyIp(ip=f"10.0.0.{index}", health_port=8080, is_healthy=False)
+                    for index in range(1, ip_count + 1)
+                ],
+            )
+            for subdomain in subdomains
+        ]
+
+        DnsServerZoneUpdater(
+            min_interval=1,
+            connection_timeout=_CONNECTION_TIMEOUT,
+            config=_make_config(zone_origins, name_servers, a_records),
+        )
+
+        mock_make_ns_record.assert_called_once_with(
+            expected_interval, frozenset(name_servers)
+        )
+
 
 class TestInitializeZone:
     def test_creates_apex_records_and_healthy_a_records(
@@ -498,24 +579,146 @@ class TestUpdateRefresh:
                 assert a_rdataset is None
 
     @patch(_CAN_CREATE_CONNECTION)
-    def test_keeps_zone_unchanged_when_abort_happens_before_last_check(
-        self, mock_can_create_connection, basic_config
+    def test_removes_owner_names_that_lose_all_healthy_ips(
+        self, mock_can_create_connection, basic_config, caplog
     ):
         mock_can_create_connection.return_value = True
         updater = _make_updater(basic_config)
-        total_ips = sum(len(record.healthy_ips) for record in basic_config.a_records)
-        should_abort_call_count = 0
+        updater.update()
+
+        mock_can_create_connection.return_value = False
+        with caplog.at_level(logging.DEBUG):
+            updater.update()
+
+        assert set(updater.zone.keys()) == {dns.name.empty}
+        for record in basic_config.a_records:
+            assert f"A record {record.subdomain} skipped" in caplog.text
+
+    @patch(_UINT32_CURRENT_TIME)
+    @patch(_CAN_CREATE_CONNECTION)
+    def test_patches_only_changed_records_in_unsigned_zone(
+        self,
+        mock_can_create_connection,
+        mock_time,
+        basic_config,
+        a_record_all_ips_healthy,
+        a_record_ip_unhealthy,
+    ):
+        timestamps = [1000, 1001]
+        mock_time.side_effect = timestamps
+        mock_can_create_connection.side_effect = lambda ip, port, timeout: (
+            _connection_result_from_config(basic_config, ip, port, timeout)
+        )
+        updater = _make_updater(basic_config)
+        updater.update()
+        first_ns_rdataset = updater.zone.get_rdataset(
+            dns.name.empty, dns.rdatatype.NS
+        )
+        first_www_node = updater.zone.get_node(a_record_all_ips_healthy.subdomain)
+
+        mock_can_create_connection.side_effect = None
+        mock_can_create_connection.return_value = True
+        updater.update()
+
+        soa_rdataset = updater.zone.get_rdataset(dns.name.empty, dns.rdatatype.SOA)
+        assert soa_rdataset[0].serial == timestamps[1]
+        assert (
+            updater.zone.get_rdataset(dns.name.empty, dns.rdatatype.NS)
+            == first_ns_rdataset
+        )
+        assert (
+            updater.zone.get_node(a_record_all_ips_healthy.subdomain)
+            is first_www_node
+        )
+        assert (
+            updater.zone.get_rdataset(a_record_ip_unhealthy.subdomain, dns.rdatatype.A)
+            is not None
+        )
+
+    @patch(_CAN_CREATE_CONNECTION)
+    def test_rebuilds_and_resigns_signed_zone_when_a_records_change(
+        self, mock_can_create_connection, config_with_dnssec, a_record_ip_unhealthy
+    ):
+        mock_can_create_connection.side_effect = lambda ip, port, timeout: (
+            _connection_result_from_config(config_with_dnssec, ip, port, timeout)
+        )
+        drawn_keys = []
+        with patch(_ITER_RRSIG_KEY, side_effect=_recording_iter_rrsig_key(drawn_keys)):
+            updater = _make_updater(config_with_dnssec)
+        updater.update()
+        assert updater.zone.get_node(a_record_ip_unhealthy.subdomain) is None
+
+        mock_can_create_connection.side_effect = None
+        mock_can_create_connection.return_value = True
+        updater.update()
+
+        assert len(drawn_keys) == 2
+        a_node = updater.zone.get_node(a_record_ip_unhealthy.subdomain)
+        assert a_node is not None
+        _assert_rrsig_exists(a_node, dns.rdatatype.A)
+        _assert_rrsig_exists(a_node, dns.rdatatype.NSEC)
+        nsec_next_names = {
+            updater.zone.get_rdataset(name, dns.rdatatype.NSEC)[0].next.relativize(
+                updater.zone.origin
+            )
+            for name in updater.zone.keys()
+        }
+        assert nsec_next_names == set(updater.zone.keys())
 
-        def should_abort_on_last_ip():
-            nonlocal should_abort_call_count
-            should_abort_call_count += 1
-            return should_abort_call_count == total_ips
+    @patch(_THREAD_POOL_EXECUTOR)
+    @patch(_CAN_CREATE_CONNECTION)
+    def test_keeps_zone_unchanged_when_abort_happens_during_checks(
+        self, mock_can_create_connection, mock_thread_pool_executor, basic_config
+    ):
+        probe_pool = _FakeProbePool(run_probes=False)
+        mock_thread_pool_executor.return_value = probe_pool
+        updater = _make_updater(basic_config)
 
-        updater.update(should_abort=should_abort_on_last_ip)
+        updater.update(should_abort=lambda: True)
 
-        assert mock_can_create_connection.call_count == total_ips - 1
+        total_ips = sum(len(record.healthy_ips) for record in basic_config.a_records)
+        assert len(probe_pool.submitted) == total_ips
+        mock_can_create_connection.assert_not_called()
+        probe_pool.shutdown.assert_called_once_with(wait=True, cancel_futures=True)
         assert len(list(updater.zone.keys())) == 0
 
+    @patch(_WAIT)
+    @patch(_THREAD_POOL_EXECUTOR)
+    @patch(_CAN_CREATE_CONNECTION)
+    def test_submits_all_health_probes_to_one_pool_before_waiting(
+        self,
+        mock_can_create_connection,
+        mock_thread_pool_executor,
+        mock_wait,
+        basic_config,
+    ):
+        mock_can_create_connection.return_value = True
+        probe_pool = _FakeProbePool(run_probes=True)
+        mock_thread_pool_executor.return_value = probe_pool
+        submitted_at_wait = []
+
+        def recording_wait(futures, timeout):
+            submitted_at_wait.append(len(probe_pool.submitted))
+            return wait(futures, timeout=timeout)
+
+        mock_wait.side_effect = recording_wait
+        updater = _make_updater(basic_config)
+
+        updater.update()
+
+        total_ips = sum(len(record.healthy_ips) for record in basic_config.a_records)
+        assert submitted_at_wait == [total_ips]
+        mock_thread_pool_executor.assert_called_once()
+        assert mock_thread_pool_executor.call_args.kwargs["max_workers"] == total_ips
+        assert len(probe_pool.submitted) == total_ips
+        assert mock_can_create_connection.call_count == total_ips
+        probe_pool.shutdown.assert_called_once_with(wait=True, cancel_futures=True)
+        for record in basic_config.a_records:
+            assert (
+                updater.zone.get_rdataset(record.subdomain, dns.rdatatype.A)
+                is not None
+            )
+
     @patch(_CAN_CREATE_CONNECTION)
     def test_first_update_recreates_zone_even_without_health_changes(
         self, mock_can_create_connection, basic_config, name_servers
@@ -559,6 +762,95 @@ class TestUpdateRefresh:
         assert len(dnskey_rdataset) == 1
         _assert_rrsig_exists(root_node, dns.rdatatype.DNSKEY)
 
+    @patch(_CAN_CREATE_CONNECTION)
+    def test_probes_backend_shared_by_several_records_once_per_update(
+        self, mock_can_create_connection, zone_origins, name_servers
+    ):
+        mock_can_create_connection.return_value = True
+        a_records = [
+            AHealthyRecord(
+                subdomain=dns.name.from_text(subdomain, origin=zone_origins.primary),
+                healthy_ips=[
+                    AHealthyIp(ip="192.168.1.1", health_port=8080, is_healthy=False)
+                ],
+            )
+            for subdomain in ("www", "api")
+        ]
+        updater = _make_updater(_make_config(zone_origins, name_servers, a_records))
+
+        updater.update()
+
+        mock_can_create_connection.assert_called_once_with(
+            "192.168.1.1", 8080, timeout=float(_CONNECTION_TIMEOUT)
+        )
+        for a_record in a_records:
+            assert (
+                updater.zone.get_rdataset(a_record.subdomain, dns.rdatatype.A)
+                is not None
+            )
+
+        updater.update()
+
+        assert mock_can_create_connection.call_count == 2
+
+
+class TestZoneSignExpiry:
+    @pytest.mark.parametrize(
+        "seconds_from_resign, expected_signings",
+        [
+            (-1, 1),
+            (0, 2),
+            (1, 2),
+        ],
+    )
+    @patch(_CAN_CREATE_CONNECTION)
+    def test_resigns_zone_once_next_signing_time_is_reached(
+        self,
+        mock_can_create_connection,
+        seconds_from_resign,
+        expected_signings,
+        config_with_dnssec,
+    ):
+        mock_can_create_connection.side_effect = lambda ip, port, timeout: (
+            _connection_result_from_config(config_with_dnssec, ip, port, timeout)
+        )
+        drawn_keys = []
+
+        with patch(_ITER_RRSIG_KEY, side_effect=_recording_iter_rrsig_key(drawn_keys)):
+            updater = _make_updater(config_with_dnssec)
+        updater.update()
+        resign = drawn_keys[0].resign
+
+        with patch(_DATETIME) as mock_datetime:
+            mock_datetime.datetime.now.return_value = resign + datetime.timedelta(
+                seconds=seconds_from_resign
+            )
+            updater.update()
+
+        assert len(drawn_keys) == expected_signings
+
+    @patch(_UINT32_CURRENT_TIME)
+    @patch(_CAN_CREATE_CONNECTION)
+    def test_never_rebuilds_unchanged_zone_without_dnssec(
+        self, mock_can_create_connection, mock_time, basic_config
+    ):
+        timestamps = [1000, 1001]
+        mock_time.side_effect = timestamps
+        mock_can_create_connection.side_effect = lambda ip, port, timeout: (
+            _connection_result_from_config(basic_config, ip, port, timeout)
+        )
+        updater = _make_updater(basic_config)
+        updater.update()
+
+        with patch(_DATETIME) as mock_datetime:
+            mock_datetime.datetime.now.return_value = datetime.datetime.max.replace(
+                tzinfo=datetime.timezone.utc
+            )
+            updater.update()
+
+        soa_rdataset = updater.zone.get_rdataset(dns.name.empty, dns.rdatatype.SOA)
+        assert soa_rdataset[0].serial == timestamps[0]
+
 
 class TestStaticARecords:
     @pytest.mark.parametrize(
@@ -41,8 +41,13 @@ def config(zone_origins):
 
     return DnsServerConfig(
         zone_origins=zone_origins,
-        primary_name_server="ns1.dns.example.net",
-        name_servers=frozenset(["ns1.dns.example.net", "ns2.dns.example.net"]),
+        primary_name_server=dns.name.from_text("ns1.dns.example.net"),
+        name_servers=frozenset(
+            [
+                dns.name.from_text("ns1.dns.example.net"),
+                dns.name.from_text("ns2.dns.example.net"),
+            ]
+        ),
         a_records=frozenset([a_record]),
         ext_private_key=None,
     )
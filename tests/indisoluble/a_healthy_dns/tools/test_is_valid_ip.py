@@ -58,6 +58,7 @@ class TestInvalidIpAddresses:
             "192.168.1",
             "192.168.1.1.5",
             "",
+            "1." * 1000 + "1",
         ],
     )
     def test_rejects_wrong_octet_count(self, invalid_ip):
@@ -77,6 +78,18 @@ class TestInvalidIpAddresses:
     def test_rejects_invalid_octets(self, invalid_ip):
         _assert_invalid_ip(invalid_ip, "Each octet must be a number between 0 and 255")
 
+    @pytest.mark.parametrize(
+        "invalid_ip",
+        [
+            "\uff11\uff19\uff12.168.1.1",
+            "192.168.1.\u00b2",
+            "192.168.1.\u0661",
+        ],
+        ids=["fullwidth-digits", "superscript-digit", "arabic-indic-digit"],
+    )
+    def test_rejects_non_ascii_digits(self, invalid_ip):
+        _assert_invalid_ip(invalid_ip, "Each octet must be a number between 0 and 255")
+
     @pytest.mark.parametrize(
         "invalid_ip",
         [